@@ -8,6 +8,7 @@ import logging
 from datetime import datetime
 import uuid
 import base64
+import hashlib
 from shared.middleware.auth import auth_required, business_type_required
 from shared.utils.helpers import success_response, error_response
 from shared.utils.validators import validate_request_data
@@ -19,6 +20,13 @@ logger = logging.getLogger(__name__)
 # 模拟加密操作记录
 USER_OPERATIONS = {}
 
+# 哈希算法名称到构造函数的映射，未知算法回退到SHA256
+HASH_FUNCTIONS = {
+    'SHA256': hashlib.sha256,
+    'SHA512': hashlib.sha512,
+    'MD5': hashlib.md5,
+}
+
 @encryption_bp.route('/encrypt', methods=['POST'])
 @auth_required
 @business_type_required(['crypto'])
@@ -507,13 +515,5 @@ def simulate_signature_verification(message, signature, key_id, hash_algorithm):
 
 def simulate_hashing(message, algorithm):
     """模拟哈希计算"""
-    import hashlib
-    
-    if algorithm == 'SHA256':
-        return hashlib.sha256(message.encode()).hexdigest()
-    elif algorithm == 'SHA512':
-        return hashlib.sha512(message.encode()).hexdigest()
-    elif algorithm == 'MD5':
-        return hashlib.md5(message.encode()).hexdigest()
-    else:
-        return hashlib.sha256(message.encode()).hexdigest()
\ No newline at end of file
+    hash_func = HASH_FUNCTIONS.get(algorithm, hashlib.sha256)
+    return hash_func(message.encode('utf-8')).hexdigest()
\ No newline at end of file
@@ -4,10 +4,22 @@
 """
 
 import jwt
+import json
 from datetime import datetime, timedelta
 from functools import wraps
-from flask import current_app, request, jsonify, session
+from flask import current_app, request, session
 from werkzeug.security import check_password_hash
+from shared.services.user_service import UserService
+
+
+# 固定的拒绝响应体在导入时序列化，拒绝路径不再经过jsonify
+UNAUTHORIZED_BODY = json.dumps({'error': '未授权访问', 'code': 401}, sort_keys=True, separators=(',', ':'))
+ADMIN_REQUIRED_BODY = json.dumps({'error': '需要管理员权限', 'code': 403}, sort_keys=True, separators=(',', ':'))
+
+
+def json_error_response(body, status):
+    """用预先序列化的JSON构造错误响应"""
+    return current_app.response_class(body, status=status, mimetype='application/json')
 
 
 def generate_token(user_id, business_type, expires_in=24*60*60):
@@ -72,25 +84,28 @@ def auth_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if not verify_token():
-            return jsonify({'error': '未授权访问', 'code': 401}), 401
+            return json_error_response(UNAUTHORIZED_BODY, 401)
         return f(*args, **kwargs)
     return decorated_function
 
 
 def business_type_required(allowed_types):
     """业务类型限制装饰器"""
+    # 在装饰时构建集合和拒绝响应体，请求路径上只做一次哈希查找
+    allowed = frozenset(allowed_types)
+    forbidden_body = json.dumps({
+        'error': f'权限不足，需要以下业务类型之一: {", ".join(allowed_types)}',
+        'code': 403
+    }, sort_keys=True, separators=(',', ':'))
+    
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             if not verify_token():
-                return jsonify({'error': '未授权访问', 'code': 401}), 401
+                return json_error_response(UNAUTHORIZED_BODY, 401)
                 
-            user_business_type = session.get('business_type')
-            if user_business_type not in allowed_types:
-                return jsonify({
-                    'error': f'权限不足，需要以下业务类型之一: {", ".join(allowed_types)}',
-                    'code': 403
-                }), 403
+            if session.get('business_type') not in allowed:
+                return json_error_response(forbidden_body, 403)
                 
             return f(*args, **kwargs)
         return decorated_function
@@ -102,15 +117,14 @@ def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if not verify_token():
-            return jsonify({'error': '未授权访问', 'code': 401}), 401
+            return json_error_response(UNAUTHORIZED_BODY, 401)
             
         # 这里可以添加管理员权限检查逻辑
         user_id = session.get('user_id')
-        from shared.services.user_service import UserService
         user = UserService.get_user_by_id(user_id)
         
         if not user or user.user_type != 'server':
-            return jsonify({'error': '需要管理员权限', 'code': 403}), 403
+            return json_error_response(ADMIN_REQUIRED_BODY, 403)
             
         return f(*args, **kwargs)
     return decorated_function
\ No newline at end of file
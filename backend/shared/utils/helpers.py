@@ -3,8 +3,41 @@
 提供通用的响应格式化、数据处理等功能
 """
 
+import os
+import re
+import secrets
 from datetime import datetime
-from flask import jsonify
+from flask import current_app, jsonify
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 预编译的正则
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def json_response(payload):
+    """序列化JSON响应，orjson可用时直接编码为bytes"""
+    if not ORJSON_AVAILABLE:
+        return jsonify(payload)
+    
+    # 日期、Decimal等类型交给Flask默认的序列化规则
+    try:
+        body = orjson.dumps(
+            payload,
+            default=current_app.json.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        )
+    except orjson.JSONEncodeError:
+        # orjson不支持的数据（如超过64位的整数）退回jsonify
+        return jsonify(payload)
+    return current_app.response_class(body, mimetype='application/json')
 
 
 def success_response(data=None, message="操作成功", code=200):
@@ -19,7 +52,7 @@ def success_response(data=None, message="操作成功", code=200):
     if data is not None:
         response['data'] = data
     
-    return jsonify(response), code
+    return json_response(response), code
 
 
 def error_response(message="操作失败", code=400, details=None):
@@ -34,7 +67,7 @@ def error_response(message="操作失败", code=400, details=None):
     if details:
         response['details'] = details
     
-    return jsonify(response), code
+    return json_response(response), code
 
 
 def paginate_response(query, page, per_page, error_out=False):
@@ -88,15 +121,12 @@ def safe_float(value, default=0.0):
 
 def generate_filename(original_filename, user_id):
     """生成安全的文件名"""
-    import os
-    import uuid
-    
     # 获取文件扩展名
     ext = os.path.splitext(original_filename)[1]
     
     # 生成新文件名
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    unique_id = str(uuid.uuid4())[:8]
+    unique_id = secrets.token_hex(4)
     
     return f"{user_id}_{timestamp}_{unique_id}{ext}"
 
@@ -121,13 +151,11 @@ def format_file_size(size_bytes):
     if size_bytes == 0:
         return "0B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    import math
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
+    # 单位下标即以1024为底的指数，由位长直接得出
+    i = min(max((int(size_bytes).bit_length() - 1) // 10, 0), len(_SIZE_UNITS) - 1)
+    s = round(size_bytes / (1 << (10 * i)), 2)
     
-    return f"{s} {size_names[i]}"
+    return f"{s} {_SIZE_UNITS[i]}"
 
 
 def is_valid_business_type(business_type):
@@ -155,29 +183,31 @@ def sanitize_input(text, max_length=None):
         text = text[:max_length]
     
     # 简单的HTML标签清理（可以使用bleach库进行更严格的清理）
-    import re
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _HTML_TAG_RE.sub('', text)
     
     return text
 
 
 def generate_session_id():
     """生成会话ID"""
-    import uuid
     timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-    unique_id = str(uuid.uuid4()).replace('-', '')[:12]
+    unique_id = secrets.token_hex(6)
     return f"session_{timestamp}_{unique_id}"
 
 
 def validate_email(email):
     """验证邮箱格式"""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def mask_sensitive_data(data, fields_to_mask):
     """脱敏敏感数据"""
+    # 字段列表只在顶层转换一次集合，递归时每个键一次哈希查找
+    return _mask_sensitive_data(data, frozenset(fields_to_mask))
+
+
+def _mask_sensitive_data(data, fields_to_mask):
+    """按字段集合递归脱敏"""
     if isinstance(data, dict):
         result = {}
         for key, value in data.items():
@@ -186,10 +216,12 @@ def mask_sensitive_data(data, fields_to_mask):
                     result[key] = value[:2] + '*' * (len(value) - 4) + value[-2:]
                 else:
                     result[key] = '***'
+            elif isinstance(value, (dict, list)):
+                result[key] = _mask_sensitive_data(value, fields_to_mask)
             else:
-                result[key] = mask_sensitive_data(value, fields_to_mask)
+                result[key] = value
         return result
     elif isinstance(data, list):
-        return [mask_sensitive_data(item, fields_to_mask) for item in data]
+        return [_mask_sensitive_data(item, fields_to_mask) for item in data]
     else:
         return data
\ No newline at end of file
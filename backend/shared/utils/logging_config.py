@@ -7,6 +7,7 @@ import logging
 import logging.handlers
 import os
 import json
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -413,14 +414,14 @@ def init_logging(app, config: Dict[str, Any] = None):
     @app.before_request
     def before_request():
         """请求开始时的处理"""
-        g.request_start_time = datetime.now()
+        g.request_start_time = time.perf_counter()
         g.request_id = str(uuid.uuid4())[:8]
     
     @app.after_request
     def after_request(response):
         """请求结束时的处理"""
         if hasattr(g, 'request_start_time'):
-            duration = (datetime.now() - g.request_start_time).total_seconds()
+            duration = time.perf_counter() - g.request_start_time
             
             # 确定业务类型
             business_type = 'unknown'
@@ -58,6 +58,11 @@ class ApplicationMonitoring:
             ['status', 'business_type']
         )
         
+        # 标签组合首次使用时解析子指标并缓存，之后只需一次元组键查找；
+        # 不在初始化时预先创建，避免导出从未记录过的零值序列
+        self._active_session_children = {}
+        self._training_session_children = {}
+        
         self.transactions_total = Counter(
             'fed_mpc_web_transactions_total',
             'Total blockchain transactions',
@@ -137,10 +142,12 @@ class ApplicationMonitoring:
         if not self.enabled:
             return
         
-        self.training_sessions.labels(
-            status=status,
-            business_type=business_type
-        ).inc()
+        child = self._training_session_children.get((status, business_type))
+        if child is None:
+            child = self.training_sessions.labels(status=status, business_type=business_type)
+            self._training_session_children[(status, business_type)] = child
+        
+        child.inc()
     
     def record_transaction(self, status: str, transaction_type: str):
         """记录区块链交易指标"""
@@ -197,7 +204,12 @@ class ApplicationMonitoring:
         if not self.enabled:
             return
         
-        self.active_sessions.labels(business_type=business_type).set(count)
+        child = self._active_session_children.get(business_type)
+        if child is None:
+            child = self.active_sessions.labels(business_type=business_type)
+            self._active_session_children[business_type] = child
+        
+        child.set(count)
     
     def update_database_connections(self, count: int):
         """更新数据库连接数量"""
@@ -228,11 +240,11 @@ def monitor_request_duration(business_type: str = 'unknown'):
     def decorator(f):
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = f(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 # 记录成功请求
                 monitoring.record_http_request(
@@ -246,7 +258,7 @@ def monitor_request_duration(business_type: str = 'unknown'):
                 return result
                 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 # 记录错误请求
                 monitoring.record_http_request(
@@ -274,16 +286,16 @@ def monitor_database_query(query_type: str = 'select'):
     def decorator(f):
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = f(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 monitoring.record_database_query(duration, query_type)
                 return result
                 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 monitoring.record_database_query(duration, query_type)
                 monitoring.record_error(
                     error_type=type(e).__name__,
@@ -347,13 +359,13 @@ def init_monitoring(app):
     @app.before_request
     def before_request():
         """请求开始时记录时间"""
-        g.start_time = time.time()
+        g.start_time = time.perf_counter()
     
     @app.after_request
     def after_request(response):
         """请求结束时记录指标"""
         if hasattr(g, 'start_time'):
-            duration = time.time() - g.start_time
+            duration = time.perf_counter() - g.start_time
             
             # 从URL确定业务类型
             business_type = 'unknown'
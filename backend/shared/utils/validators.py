@@ -5,9 +5,24 @@
 
 import re
 import json
+import string
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 
+# 邮箱各部分允许的字符
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+
+# 清理输入时删除的危险字符
+_DANGEROUS_CHARS_TABLE = str.maketrans('', '', '<>"\'&\0\n\r\t')
+
+# 预编译的校验正则
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+_LETTER_RE = re.compile(r'[a-zA-Z]')
+_DIGIT_RE = re.compile(r'\d')
+_IPV4_RE = re.compile(r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
+_IPV6_RE = re.compile(r'^([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$')
+
 
 def validate_request_data(data: Dict[str, Any], required_fields: List[str]) -> bool:
     """验证请求数据是否包含必填字段"""
@@ -15,11 +30,13 @@ def validate_request_data(data: Dict[str, Any], required_fields: List[str]) -> b
         return False
     
     for field in required_fields:
-        if field not in data or data[field] is None:
+        # 缺失字段与None值一次查找即可判定
+        value = data.get(field)
+        if value is None:
             return False
         
         # 检查字符串字段是否为空
-        if isinstance(data[field], str) and not data[field].strip():
+        if isinstance(value, str) and not value.strip():
             return False
     
     return True
@@ -30,8 +47,16 @@ def validate_email(email: str) -> bool:
     if not isinstance(email, str):
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email.strip()))
+    # 等价于 ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$，用字符串方法逐段检查
+    local, at, domain = email.strip().partition('@')
+    if not local or not at:
+        return False
+    
+    host, _, tld = domain.rpartition('.')
+    if not host or len(tld) < 2 or not (tld.isascii() and tld.isalpha()):
+        return False
+    
+    return _EMAIL_LOCAL_CHARS.issuperset(local) and _EMAIL_DOMAIN_CHARS.issuperset(host)
 
 
 def validate_username(username: str) -> bool:
@@ -45,8 +70,7 @@ def validate_username(username: str) -> bool:
     if len(username) < 3 or len(username) > 20:
         return False
     
-    pattern = r'^[a-zA-Z0-9_]+$'
-    return bool(re.match(pattern, username))
+    return bool(_USERNAME_RE.match(username))
 
 
 def validate_password(password: str) -> Dict[str, Union[bool, str]]:
@@ -61,10 +85,7 @@ def validate_password(password: str) -> Dict[str, Union[bool, str]]:
         return {'valid': False, 'message': '密码长度不能超过128位'}
     
     # 检查是否包含字母和数字
-    has_letter = bool(re.search(r'[a-zA-Z]', password))
-    has_digit = bool(re.search(r'\d', password))
-    
-    if not (has_letter and has_digit):
+    if not (_LETTER_RE.search(password) and _DIGIT_RE.search(password)):
         return {'valid': False, 'message': '密码必须包含字母和数字'}
     
     return {'valid': True, 'message': '密码格式正确'}
@@ -199,11 +220,7 @@ def sanitize_string(text: str, max_length: int = 255) -> str:
         text = text[:max_length]
     
     # 移除危险字符
-    dangerous_chars = ['<', '>', '"', "'", '&', '\0', '\n', '\r', '\t']
-    for char in dangerous_chars:
-        text = text.replace(char, '')
-    
-    return text
+    return text.translate(_DANGEROUS_CHARS_TABLE)
 
 
 def validate_ip_address(ip: str) -> bool:
@@ -212,13 +229,11 @@ def validate_ip_address(ip: str) -> bool:
         return False
     
     # IPv4格式验证
-    ipv4_pattern = r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    if re.match(ipv4_pattern, ip):
+    if _IPV4_RE.match(ip):
         return True
     
     # IPv6格式验证（简化）
-    ipv6_pattern = r'^([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$'
-    if re.match(ipv6_pattern, ip):
+    if _IPV6_RE.match(ip):
         return True
     
     return False
@@ -273,29 +288,38 @@ def validate_or_raise(condition: bool, message: str, field: str = None):
         raise ValidationError(message, field)
 
 
-def validate_training_config(config: Dict[str, Any]) -> Dict[str, Union[bool, str]]:
-    """验证训练配置"""
+def validate_usage_purpose(usage_purpose: str) -> bool:
+    """验证密钥使用目的"""
+    valid_purposes = ['encryption', 'signing', 'authentication', 'key_exchange']
+    return usage_purpose in valid_purposes
+
+
+# 配置校验规则表: (字段, 校验函数, 错误信息)，按顺序逐条校验
+_TRAINING_CONFIG_REQUIRED = ['model_type', 'learning_rate', 'epochs', 'batch_size']
+_TRAINING_CONFIG_SPEC = (
+    (('model_type',), validate_model_type, '无效的模型类型'),
+    (('learning_rate',), validate_learning_rate, '学习率必须在0.0001-1.0之间'),
+    (('epochs',), validate_epochs, '训练轮数必须在1-10000之间'),
+    (('batch_size',), validate_batch_size, '批次大小必须在1-1024之间'),
+)
+
+_CRYPTO_CONFIG_REQUIRED = ['key_type', 'key_size', 'usage_purpose']
+_CRYPTO_CONFIG_SPEC = (
+    (('key_type',), validate_key_type, '无效的密钥类型'),
+    (('key_type', 'key_size'), validate_key_size, '无效的密钥长度'),
+    (('usage_purpose',), validate_usage_purpose, '无效的使用目的'),
+)
+
+
+def _validate_config(config: Dict[str, Any], required_fields: List[str], spec) -> Dict[str, Union[bool, str]]:
+    """按规则表校验配置"""
     try:
-        # 验证必填字段
-        required_fields = ['model_type', 'learning_rate', 'epochs', 'batch_size']
         if not validate_request_data(config, required_fields):
             return {'valid': False, 'message': '缺少必填字段'}
         
-        # 验证模型类型
-        if not validate_model_type(config['model_type']):
-            return {'valid': False, 'message': '无效的模型类型'}
-        
-        # 验证学习率
-        if not validate_learning_rate(config['learning_rate']):
-            return {'valid': False, 'message': '学习率必须在0.0001-1.0之间'}
-        
-        # 验证训练轮数
-        if not validate_epochs(config['epochs']):
-            return {'valid': False, 'message': '训练轮数必须在1-10000之间'}
-        
-        # 验证批次大小
-        if not validate_batch_size(config['batch_size']):
-            return {'valid': False, 'message': '批次大小必须在1-1024之间'}
+        for fields, validator, message in spec:
+            if not validator(*map(config.__getitem__, fields)):
+                return {'valid': False, 'message': message}
         
         return {'valid': True, 'message': '配置验证通过'}
     
@@ -303,28 +327,11 @@ def validate_training_config(config: Dict[str, Any]) -> Dict[str, Union[bool, st
         return {'valid': False, 'message': f'配置验证失败: {str(e)}'}
 
 
+def validate_training_config(config: Dict[str, Any]) -> Dict[str, Union[bool, str]]:
+    """验证训练配置"""
+    return _validate_config(config, _TRAINING_CONFIG_REQUIRED, _TRAINING_CONFIG_SPEC)
+
+
 def validate_crypto_config(config: Dict[str, Any]) -> Dict[str, Union[bool, str]]:
     """验证加密配置"""
-    try:
-        # 验证必填字段
-        required_fields = ['key_type', 'key_size', 'usage_purpose']
-        if not validate_request_data(config, required_fields):
-            return {'valid': False, 'message': '缺少必填字段'}
-        
-        # 验证密钥类型
-        if not validate_key_type(config['key_type']):
-            return {'valid': False, 'message': '无效的密钥类型'}
-        
-        # 验证密钥长度
-        if not validate_key_size(config['key_type'], config['key_size']):
-            return {'valid': False, 'message': '无效的密钥长度'}
-        
-        # 验证使用目的
-        valid_purposes = ['encryption', 'signing', 'authentication', 'key_exchange']
-        if config['usage_purpose'] not in valid_purposes:
-            return {'valid': False, 'message': '无效的使用目的'}
-        
-        return {'valid': True, 'message': '配置验证通过'}
-    
-    except Exception as e:
-        return {'valid': False, 'message': f'配置验证失败: {str(e)}'}
\ No newline at end of file
+    return _validate_config(config, _CRYPTO_CONFIG_REQUIRED, _CRYPTO_CONFIG_SPEC)
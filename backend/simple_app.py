@@ -9,6 +9,12 @@ import jwt
 from datetime import datetime, timedelta
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 创建Flask应用
 app = Flask(__name__)
 
@@ -62,10 +68,16 @@ MOCK_USERS = {
     }
 }
 
+def json_response(payload, status=200):
+    """构造JSON响应，orjson可用时绕过jsonify直接序列化为bytes"""
+    if not ORJSON_AVAILABLE:
+        return jsonify(payload), status
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
 # 健康检查接口
 @app.route('/api/health')
 def health_check():
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'version': '1.0.0'
@@ -79,7 +91,7 @@ def login():
         data = request.get_json()
         
         if not data:
-            return jsonify({'error': '请求数据为空'}), 400
+            return json_response({'error': '请求数据为空'}, 400)
         
         user_type = data.get('userType')
         business_type = data.get('businessType')
@@ -89,26 +101,26 @@ def login():
         if user_type == 'client':
             username = data.get('username')
             if not username:
-                return jsonify({'error': '用户名不能为空'}), 400
+                return json_response({'error': '用户名不能为空'}, 400)
             user_id = username
         else:  # server
             admin_id = data.get('adminId')
             if not admin_id:
-                return jsonify({'error': '管理员ID不能为空'}), 400
+                return json_response({'error': '管理员ID不能为空'}, 400)
             user_id = admin_id
         
         # 验证用户
         user_data = MOCK_USERS.get(user_type, {}).get(user_id)
         if not user_data:
-            return jsonify({'error': '用户不存在'}), 401
+            return json_response({'error': '用户不存在'}, 401)
         
         # 验证密码
         if user_data['password'] != password:
-            return jsonify({'error': '密码错误'}), 401
+            return json_response({'error': '密码错误'}, 401)
         
         # 验证业务类型
         if user_data['business_type'] != business_type:
-            return jsonify({'error': '业务类型不匹配'}), 401
+            return json_response({'error': '业务类型不匹配'}, 401)
         
         # 生成token
         token_payload = {
@@ -132,11 +144,11 @@ def login():
         }
         
         app.logger.info(f'用户登录成功: {user_id} ({user_type})')
-        return jsonify(response_data), 200
+        return json_response(response_data, 200)
         
     except Exception as e:
         app.logger.error(f'登录错误: {str(e)}')
-        return jsonify({'error': '登录失败，请稍后重试'}), 500
+        return json_response({'error': '登录失败，请稍后重试'}, 500)
 
 @app.route('/api/auth/verify', methods=['GET'])
 def verify_token():
@@ -145,36 +157,36 @@ def verify_token():
         auth_header = request.headers.get('Authorization')
         
         if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'error': 'Token缺失'}), 401
+            return json_response({'error': 'Token缺失'}, 401)
         
         token = auth_header.split(' ')[1]
         
         try:
             payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
             
-            return jsonify({
+            return json_response({
                 'valid': True,
                 'user': {
                     'id': payload['user_id'],
                     'type': payload['user_type'],
                     'businessType': payload['business_type']
                 }
-            }), 200
+            }, 200)
             
         except jwt.ExpiredSignatureError:
-            return jsonify({'error': 'Token已过期'}), 401
+            return json_response({'error': 'Token已过期'}, 401)
         except jwt.InvalidTokenError:
-            return jsonify({'error': 'Token无效'}), 401
+            return json_response({'error': 'Token无效'}, 401)
             
     except Exception as e:
         app.logger.error(f'Token验证错误: {str(e)}')
-        return jsonify({'error': '验证失败'}), 500
+        return json_response({'error': '验证失败'}, 500)
 
 # AI模块API
 @app.route('/api/ai/dashboard', methods=['GET'])
 def ai_dashboard():
     """AI仪表盘数据"""
-    return jsonify({
+    return json_response({
         'stats': {
             'trainingProjects': 23,
             'activeClients': 8,
@@ -192,7 +204,7 @@ def ai_dashboard():
 @app.route('/api/blockchain/dashboard', methods=['GET'])
 def blockchain_dashboard():
     """区块链仪表盘数据"""
-    return jsonify({
+    return json_response({
         'stats': {
             'smartContracts': 12,
             'activeTransactions': 2847,
@@ -209,7 +221,7 @@ def blockchain_dashboard():
 @app.route('/api/crypto/dashboard', methods=['GET'])
 def crypto_dashboard():
     """密钥加密仪表盘数据"""
-    return jsonify({
+    return json_response({
         'stats': {
             'totalKeys': 24,
             'activeKeys': 18,
@@ -226,11 +238,11 @@ def crypto_dashboard():
 # 错误处理
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': '接口不存在'}), 404
+    return json_response({'error': '接口不存在'}, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({'error': '服务器内部错误'}), 500
+    return json_response({'error': '服务器内部错误'}, 500)
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
@@ -3,15 +3,49 @@ Gunicorn配置文件
 生产环境Flask应用服务器配置
 """
 
-import multiprocessing
+import logging
 import os
+import threading
+import time
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+from gunicorn.glogging import Logger
 
 # 服务器绑定
 bind = "127.0.0.1:5000"
-backlog = 2048
+backlog = 16384  # 实际长度受内核net.core.somaxconn限制
+listen_queue_interval = 5  # 监听队列采样间隔（秒）
+
+def _available_cpus():
+    """容器内可用的CPU数，优先按cgroup配额计算"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+    # cgroup v2: "配额 周期"，不限制时配额为max
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, min(cpus, int(quota) // int(period)))
+        return cpus
+    except (OSError, ValueError):
+        pass
+
+    # cgroup v1: 不限制时配额为-1
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota > 0:
+            return max(1, min(cpus, quota // period))
+    except (OSError, ValueError):
+        pass
+
+    return cpus
 
 # 工作进程配置
-workers = multiprocessing.cpu_count() * 2 + 1  # 推荐配置
+# gevent worker的并发来自worker_connections，进程数不必随核数无限增长
+workers = min(_available_cpus() * 2 + 1, 8)
 worker_class = "gevent"  # 异步工作模式
 worker_connections = 1000
 max_requests = 1000  # 处理请求数后重启worker
@@ -35,6 +69,74 @@ loglevel = "info"
 accesslog = "/app/logs/gunicorn_access.log"
 errorlog = "/app/logs/gunicorn_error.log"
 access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s" %(D)s'
+access_log_buffer_size = 16384  # 访问日志写缓冲（字节）
+access_log_flush_interval = 0.2  # 访问日志定时刷新间隔（秒）
+
+
+class BufferedAccessFileHandler(logging.FileHandler):
+    """带写缓冲的访问日志文件处理器，缓冲满或定时刷新时才落盘"""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=access_log_buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        # 每条日志不再单独触发write()，交由缓冲区和定时线程处理
+        pass
+
+    def force_flush(self):
+        """将缓冲区内容写入文件"""
+        self.acquire()
+        try:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class BufferedLogger(Logger):
+    """访问日志使用缓冲写入的Gunicorn日志类"""
+
+    _flusher_pid = None
+
+    def setup(self, cfg):
+        super().setup(cfg)
+
+        if cfg.accesslog in (None, "-"):
+            return
+
+        for handler in list(self.access_log.handlers):
+            if isinstance(handler, logging.FileHandler):
+                buffered = BufferedAccessFileHandler(handler.baseFilename)
+                buffered.setFormatter(handler.formatter)
+                self.access_log.removeHandler(handler)
+                handler.close()
+                self.access_log.addHandler(buffered)
+
+    def access(self, resp, req, environ, request_time):
+        # 日志对象在master中创建，刷新线程需在各worker进程内启动
+        if self._flusher_pid != os.getpid():
+            self._start_flusher()
+        super().access(resp, req, environ, request_time)
+
+    def _start_flusher(self):
+        self._flusher_pid = os.getpid()
+        thread = threading.Thread(target=self._flush_loop, name="access-log-flusher", daemon=True)
+        thread.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(access_log_flush_interval)
+            self.flush_access_log()
+
+    def flush_access_log(self):
+        """刷新所有缓冲的访问日志处理器"""
+        for handler in self.access_log.handlers:
+            if isinstance(handler, BufferedAccessFileHandler):
+                handler.force_flush()
+
+
+logger_class = BufferedLogger
 
 # 安全配置
 limit_request_line = 4096
@@ -48,10 +150,98 @@ sendfile = True  # 使用sendfile进行文件传输
 # keyfile = "/path/to/keyfile"
 # certfile = "/path/to/certfile"
 
+def _listener_inodes(server):
+    """获取监听socket的inode编号"""
+    inodes = set()
+    for listener in server.LISTENERS:
+        try:
+            link = os.readlink(f"/proc/self/fd/{listener.fileno()}")
+        except OSError:
+            continue
+        if link.startswith("socket:["):
+            inodes.add(link[len("socket:["):-1])
+    return inodes
+
+def _read_listen_queue(inodes):
+    """从/proc/net/tcp读取监听socket当前accept队列长度"""
+    queued = 0
+    for path in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(path) as f:
+                next(f)  # 跳过表头
+                for line in f:
+                    fields = line.split()
+                    # st为0A表示LISTEN，此时rx_queue即为等待accept的连接数
+                    if fields[3] == "0A" and fields[9] in inodes:
+                        queued += int(fields[4].split(":")[1], 16)
+        except OSError:
+            continue
+    return queued
+
+def _effective_backlog():
+    """内核实际生效的backlog长度"""
+    try:
+        with open("/proc/sys/net/core/somaxconn") as f:
+            return min(backlog, int(f.read()))
+    except (OSError, ValueError):
+        return backlog
+
+class _QuietHandler(WSGIRequestHandler):
+    """不为每次抓取写stderr日志"""
+
+    def log_message(self, format, *args):
+        pass
+
+# master中的指标HTTP服务；fork出的worker会继承其监听fd，在post_fork中关闭
+_metrics_httpd = None
+
+def _start_metrics_server(server, registry):
+    """在METRICS_PORT上导出master的指标，端口被占用时返回False以便稍后重试"""
+    global _metrics_httpd
+    from prometheus_client import make_wsgi_app
+    try:
+        httpd = make_server("", int(os.environ.get("METRICS_PORT", 9090)),
+                            make_wsgi_app(registry), handler_class=_QuietHandler)
+    except OSError as e:
+        # USR2热升级时旧master退出前仍占用该端口
+        server.log.warning("Failed to start listen queue metrics server: %s", e)
+        return False
+    _metrics_httpd = httpd
+    threading.Thread(target=httpd.serve_forever, name="listen-queue-metrics", daemon=True).start()
+    return True
+
+def _monitor_listen_queue(server, inodes):
+    """定期采样监听队列长度，导出为Prometheus指标并在接近上限时告警"""
+    gauge = registry = None
+    try:
+        from prometheus_client import CollectorRegistry, Gauge
+        registry = CollectorRegistry()
+        gauge = Gauge("gunicorn_listen_queue_length", "Connections waiting in the listen queue",
+                      registry=registry)
+    except ImportError:
+        server.log.info("prometheus_client not installed, listen queue metric disabled")
+
+    limit = _effective_backlog()
+    serving = registry is None
+    while True:
+        if not serving:
+            serving = _start_metrics_server(server, registry)
+        queued = _read_listen_queue(inodes)
+        if gauge is not None:
+            gauge.set(queued)
+        if queued >= limit // 2:
+            server.log.warning("Listen queue is filling up: %s/%s", queued, limit)
+        time.sleep(listen_queue_interval)
+
 def when_ready(server):
     """服务器启动后的回调"""
     server.log.info("Fed_MPC_Web server is ready. Listening on: %s", server.address)
 
+    inodes = _listener_inodes(server)
+    if inodes:
+        threading.Thread(target=_monitor_listen_queue, args=(server, inodes),
+                         name="listen-queue-monitor", daemon=True).start()
+
 def worker_int(worker):
     """worker中断信号处理"""
     worker.log.info("worker received INT or QUIT signal")
@@ -64,10 +254,31 @@ def post_fork(server, worker):
     """fork worker之后的回调"""
     server.log.info("Worker spawned (pid: %s)", worker.pid)
 
+    # 指标端口只由master提供，worker不保留继承来的监听socket
+    if _metrics_httpd is not None:
+        _metrics_httpd.server_close()
+
+    # preload_app时应用在master中加载，连接池里的数据库连接会被所有worker继承；
+    # 每个worker丢弃继承来的连接（不关闭，以免影响其他进程），按需重新建立
+    try:
+        app = server.app.wsgi()
+        db = getattr(app, "extensions", {}).get("sqlalchemy")
+        if db is not None:
+            with app.app_context():
+                for engine in db.engines.values():
+                    engine.dispose(close=False)
+    except Exception as e:
+        worker.log.warning("Failed to reset database pool after fork: %s", e)
+
 def post_worker_init(worker):
     """worker初始化完成后的回调"""
     worker.log.info("Worker initialized (pid: %s)", worker.pid)
 
+def worker_exit(server, worker):
+    """worker退出时的回调，写出缓冲中的访问日志"""
+    if isinstance(server.log, BufferedLogger):
+        server.log.flush_access_log()
+
 def worker_abort(worker):
     """worker异常退出的回调"""
     worker.log.info("Worker aborted (pid: %s)", worker.pid)
@@ -7,8 +7,10 @@
 import sys
 import os
 import subprocess
-import time
 import threading
+import traceback
+import webbrowser
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
 import sqlite3
 
@@ -31,6 +33,17 @@ def create_sqlite_database():
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
+    # 演示数据可随时重建，关闭逐条fsync以加快初始化
+    cursor.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+    ''')
+    
+    # 建表与插入数据在同一个事务中完成
+    cursor.execute('BEGIN IMMEDIATE')
+    
     # 创建用户表
     cursor.execute('''
         CREATE TABLE users (
@@ -92,10 +105,12 @@ def create_sqlite_database():
         ('cryptographer', 'pbkdf2:sha256:260000$salt$hash', 'client', 'crypto', '密码学专家', '密码学研究院'),
     ]
     
-    cursor.executemany('''
-        INSERT INTO users (username, password_hash, user_type, business_type, full_name, organization)
-        VALUES (?, ?, ?, ?, ?, ?)
-    ''', demo_users)
+    # 多行VALUES一次插入，参数按行展开
+    cursor.execute(
+        'INSERT INTO users (username, password_hash, user_type, business_type, full_name, organization) '
+        'VALUES ' + ', '.join(['(?, ?, ?, ?, ?, ?)'] * len(demo_users)),
+        [value for row in demo_users for value in row]
+    )
     
     # 插入演示项目数据
     demo_projects = [
@@ -104,10 +119,11 @@ def create_sqlite_database():
         (4, '数据加密项目', '企业数据加密解决方案', 'encryption', 'standard', 'active'),
     ]
     
-    cursor.executemany('''
-        INSERT INTO projects (user_id, name, description, project_type, training_mode, status)
-        VALUES (?, ?, ?, ?, ?, ?)
-    ''', demo_projects)
+    cursor.execute(
+        'INSERT INTO projects (user_id, name, description, project_type, training_mode, status) '
+        'VALUES ' + ', '.join(['(?, ?, ?, ?, ?, ?)'] * len(demo_projects)),
+        [value for row in demo_projects for value in row]
+    )
     
     conn.commit()
     conn.close()
@@ -143,6 +159,9 @@ class DemoConfig:
     # CORS配置
     CORS_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000', 'http://localhost:8080']
     
+    # 静态文件缓存，send_from_directory据此设置Cache-Control，并按ETag/Last-Modified返回304
+    SEND_FILE_MAX_AGE_DEFAULT = 3600
+    
     # 其他配置
     JSON_AS_ASCII = False
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB
@@ -174,9 +193,16 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / 'backend'))
 
 from flask import Flask, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 
@@ -190,6 +216,21 @@ except ImportError as e:
     print(f"导入auth路由失败: {e}")
     auth_bp = None
 
+class ORJSONProvider(DefaultJSONProvider):
+    """基于orjson的JSON序列化，不支持的类型仍交给Flask默认处理"""
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 def create_demo_app():
     """创建演示应用"""
     app = Flask(__name__, static_folder=str(project_root / 'frontend'))
@@ -197,6 +238,10 @@ def create_demo_app():
     # 加载配置
     app.config.from_object(config['demo'])
     
+    # orjson可用时jsonify和request.get_json都走orjson
+    if ORJSON_AVAILABLE:
+        app.json = ORJSONProvider(app)
+    
     # 配置CORS
     CORS(app, resources={
         r"/*": {
@@ -284,7 +329,12 @@ if __name__ == '__main__':
     print("  健康检查: http://127.0.0.1:8080/api/health")
     print("  API测试: http://127.0.0.1:8080/api/test")
     
-    app.run(host='127.0.0.1', port=8080, debug=True, threaded=True)
+    # 优先使用waitress，没有安装时退回Flask自带服务器（关闭调试重载器）
+    try:
+        from waitress import serve
+        serve(app, host='127.0.0.1', port=8080, threads=8, connection_limit=1000, channel_timeout=30)
+    except ImportError:
+        app.run(host='127.0.0.1', port=8080, debug=False, threaded=True)
 '''
     
     app_path = project_root / 'demo_app.py'
@@ -298,29 +348,24 @@ def install_demo_dependencies():
     """安装演示所需依赖"""
     print("📦 检查并安装演示依赖...")
     
-    required_packages = ['flask', 'flask-cors']
+    required_packages = ['flask', 'flask-cors', 'waitress']
     
     for package in required_packages:
         try:
-            result = subprocess.run([
-                sys.executable, '-c', f'import {package.replace("-", "_")}'
-            ], capture_output=True)
-            
-            if result.returncode != 0:
-                print(f"安装 {package}...")
-                subprocess.run([sys.executable, '-m', 'pip', 'install', package])
-            else:
-                print(f"✅ {package} already installed")
+            # 在当前进程内查询包元数据，无需为每个包启动子解释器
+            distribution(package)
+            print(f"✅ {package} already installed")
+        except PackageNotFoundError:
+            print(f"安装 {package}...")
+            subprocess.run([sys.executable, '-m', 'pip', 'install', package])
         except Exception as e:
             print(f"⚠️ 检查 {package} 时出错: {e}")
     
     print("✅ 依赖检查完成")
 
-def open_browser(url, delay=3):
-    """延时打开浏览器"""
-    time.sleep(delay)
+def open_browser(url):
+    """打开浏览器"""
     try:
-        import webbrowser
         webbrowser.open(url)
         print(f"🌐 已在浏览器中打开: {url}")
     except:
@@ -349,12 +394,10 @@ def main():
         print("🚀 启动演示服务器...")
         print("="*60)
         
-        # 5. 在后台线程中打开浏览器
-        threading.Thread(
-            target=open_browser, 
-            args=('http://127.0.0.1:8080',), 
-            daemon=True
-        ).start()
+        # 5. 3秒后在后台打开浏览器
+        browser_timer = threading.Timer(3, open_browser, args=('http://127.0.0.1:8080',))
+        browser_timer.daemon = True
+        browser_timer.start()
         
         # 6. 启动Flask应用
         os.chdir(project_root)
@@ -364,18 +407,7 @@ def main():
         print("\\n👋 演示服务器已停止")
     except Exception as e:
         print(f"❌ 演示部署失败: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == '__main__':
     main()
-'''
-    
-    demo_path = project_root / 'deploy' / 'local_demo.py'
-    with open(demo_path, 'w', encoding='utf-8') as f:
-        f.write(demo_content)
-    
-    return demo_path
-
-if __name__ == '__main__':
-    main()
\ No newline at end of file
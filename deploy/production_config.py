@@ -6,6 +6,25 @@
 import os
 from datetime import timedelta
 
+try:
+    import MySQLdb  # noqa: F401
+    MYSQLDB_AVAILABLE = True
+except ImportError:
+    MYSQLDB_AVAILABLE = False
+
+
+def get_mysql_driver():
+    """选择MySQL驱动
+
+    默认使用PyMySQL：gevent worker下纯Python驱动的socket可被协程调度；
+    设置MYSQL_DRIVER=mysqldb且已安装mysqlclient时使用C驱动
+    """
+    driver = os.environ.get('MYSQL_DRIVER', 'pymysql').lower()
+    if driver == 'mysqldb' and MYSQLDB_AVAILABLE:
+        return 'mysqldb'
+    return 'pymysql'
+
+
 class ProductionConfig:
     """生产环境配置"""
     
@@ -23,17 +42,22 @@ class ProductionConfig:
     MYSQL_PASSWORD = os.environ.get('MYSQL_PASSWORD', 'your_secure_password')
     MYSQL_DB = os.environ.get('MYSQL_DB', 'fed_mpc_web')
     
+    MYSQL_DRIVER = get_mysql_driver()
+    
     SQLALCHEMY_DATABASE_URI = (
-        f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@"
+        f"mysql+{MYSQL_DRIVER}://{MYSQL_USER}:{MYSQL_PASSWORD}@"
         f"{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
-        f"?charset=utf8mb4&autocommit=true"
+        f"?charset=utf8mb4"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_size': 10,
         'pool_timeout': 20,
         'pool_recycle': 3600,
-        'max_overflow': 20
+        'max_overflow': 20,
+        'pool_pre_ping': True,  # 取出连接前检测，避免使用已断开的连接
+        'pool_use_lifo': True,  # 优先复用最近归还的连接
+        'connect_args': {'autocommit': True}  # 两种驱动都接受的连接参数
     }
     
     # JWT配置
@@ -6,50 +6,257 @@ Fed_MPC_Web 本地服务启动器
 
 import sys
 import os
+import argparse
 import subprocess
-import time
 import threading
+import time
+import traceback
+import webbrowser
+import gzip
+import hashlib
+import hmac
+import mimetypes
+import json
+import importlib.util
+from datetime import datetime
 from pathlib import Path
 
-# 添加项目路径
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Flask缺失时仍需运行到install_requirements，由--bootstrap安装后重启进程
+try:
+    from flask import Flask, request, abort
+    from flask.json.provider import DefaultJSONProvider
+    from werkzeug.wsgi import wrap_file
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+# 添加项目路径，已在sys.path中的不重复添加
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / 'backend'))
+for search_path in (str(project_root), str(project_root / 'backend')):
+    if search_path not in sys.path:
+        sys.path.insert(0, search_path)
 
-def install_requirements():
-    """安装必要的依赖"""
+def install_requirements(bootstrap=False):
+    """检查必要的依赖，bootstrap为True时一次性安装缺失的包"""
     print("📦 检查Python依赖...")
     
-    required_packages = ['flask', 'flask-cors']
+    # pip包名 -> 导入模块名
+    required_packages = {'flask': 'flask'}
     
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-            print(f"✅ {package} 已安装")
-        except ImportError:
-            print(f"⬇️ 正在安装 {package}...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', package], 
-                         check=True, capture_output=True)
+    # find_spec只定位模块，不执行模块代码
+    missing = [package for package, module in required_packages.items()
+               if importlib.util.find_spec(module) is None]
+    if not missing:
+        print("✅ 依赖已安装")
+        return
+    
+    if not bootstrap:
+        sys.exit(f"❌ 缺少依赖: {', '.join(missing)}，请加 --bootstrap 参数运行以自动安装")
+    
+    print(f"⬇️ 正在安装 {' '.join(missing)}...")
+    subprocess.run([sys.executable, '-m', 'pip', 'install', *missing],
+                   check=True, capture_output=True)
+    
+    # 模块级导入在启动时已失败，重启进程使其重新导入
+    print("🔄 依赖安装完成，重新启动...")
+    os.execv(sys.executable, [sys.executable, *sys.argv])
+
+def dump_json(payload):
+    """序列化为JSON bytes，orjson不可用时使用标准库"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# 固定内容的API响应体，启动时序列化一次
+HEALTH_BODY_PREFIX = dump_json({
+    'status': 'healthy',
+    'message': 'Fed_MPC_Web is running',
+    'version': '1.0.0',
+    'environment': 'production'
+})[:-1] + b',"timestamp":"'
+
+TEST_API_BODY = dump_json({
+    'success': True,
+    'message': 'API服务正常运行！',
+    'data': {
+        'modules': ['ai', 'blockchain', 'crypto'],
+        'features': ['联邦学习', '区块链交易', '密钥管理'],
+        'status': 'running'
+    }
+})
+
+AI_PROJECTS_BODY = dump_json({
+    'success': True,
+    'data': {
+        'projects': [
+            {'id': 1, 'name': 'CNN故障检测', 'status': 'active', 'accuracy': 0.923},
+            {'id': 2, 'name': 'LSTM预测模型', 'status': 'completed', 'accuracy': 0.887},
+            {'id': 3, 'name': '联邦学习项目', 'status': 'training', 'accuracy': 0.856}
+        ],
+        'total': 3
+    }
+})
+
+BLOCKCHAIN_TRANSACTIONS_BODY = dump_json({
+    'success': True,
+    'data': {
+        'transactions': [
+            {'hash': '0x123...abc', 'status': 'confirmed', 'amount': 1.5},
+            {'hash': '0x456...def', 'status': 'pending', 'amount': 0.8},
+            {'hash': '0x789...ghi', 'status': 'confirmed', 'amount': 2.1}
+        ],
+        'total': 3
+    }
+})
+
+CRYPTO_KEYS_BODY = dump_json({
+    'success': True,
+    'data': {
+        'keys': [
+            {'id': 1, 'name': '主RSA密钥', 'type': 'RSA', 'size': 2048},
+            {'id': 2, 'name': 'AES加密密钥', 'type': 'AES', 'size': 256},
+            {'id': 3, 'name': 'ECC签名密钥', 'type': 'ECC', 'size': 256}
+        ],
+        'total': 3
+    }
+})
+
+def compress_body(body):
+    """预先压缩响应体，返回 编码 -> 压缩内容，只保留比原文更小的结果"""
+    variants = {}
+    if BROTLI_AVAILABLE:
+        variants['br'] = brotli.compress(body, quality=11)
+    variants['gzip'] = gzip.compress(body, 9, mtime=0)
+    return {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+
+# 固定响应体的压缩版本，以原响应体为键
+COMPRESSED_BODIES = {
+    body: compress_body(body)
+    for body in (TEST_API_BODY, AI_PROJECTS_BODY, BLOCKCHAIN_TRANSACTIONS_BODY, CRYPTO_KEYS_BODY)
+}
+
+# 健康检查时间戳缓存：(整秒, ISO格式bytes)，整体替换保证线程间读到一致的值
+_timestamp_cache = (0, b'')
+
+def current_timestamp():
+    """返回当前时间的ISO格式bytes，同一秒内复用"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        cached = (now, datetime.fromtimestamp(now).isoformat().encode('ascii'))
+        _timestamp_cache = cached
+    return cached[1]
+
+if MSGSPEC_AVAILABLE:
+    class LoginRequest(msgspec.Struct):
+        """登录请求体"""
+        username: str = ''
+        password: str = ''
+    
+    # 直接把请求体解码为LoginRequest，字段类型不符时抛出ValidationError
+    LOGIN_REQUEST_DECODER = msgspec.json.Decoder(LoginRequest)
+
+LOGIN_FAILED_BODY = dump_json({'error': '用户名或密码错误'})
+
+def password_digest(password):
+    """计算用于登录比对的定长密码摘要"""
+    return hashlib.blake2b(password.encode('utf-8'), digest_size=16).digest()
+
+# 固定响应体的ETag，客户端轮询未变化的数据时返回304
+TEST_API_ETAG = hashlib.blake2b(TEST_API_BODY, digest_size=8).hexdigest()
+AI_PROJECTS_ETAG = hashlib.blake2b(AI_PROJECTS_BODY, digest_size=8).hexdigest()
+BLOCKCHAIN_TRANSACTIONS_ETAG = hashlib.blake2b(BLOCKCHAIN_TRANSACTIONS_BODY, digest_size=8).hexdigest()
+CRYPTO_KEYS_ETAG = hashlib.blake2b(CRYPTO_KEYS_BODY, digest_size=8).hexdigest()
+
+# 演示服务只允许本机页面跨域访问，任意端口
+CORS_ALLOWED_ORIGIN_PREFIXES = ('http://localhost:', 'http://127.0.0.1:')
+CORS_PREFLIGHT_HEADERS = {
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+}
+
+# 超过该大小的静态文件不常驻内存，响应时交给服务器sendfile发送
+LARGE_STATIC_FILE_SIZE = 256 * 1024
+
+def load_static_files(root):
+    """启动时一次性扫描前端目录，返回 相对路径 -> (内容, ETag, MIME类型, 文件路径)
+
+    大文件的内容为None，只记录路径
+    """
+    root = Path(root)
+    static_files = {}
+    
+    for path in root.rglob('*'):
+        if not path.is_file():
+            continue
+        
+        stat = path.stat()
+        if stat.st_size >= LARGE_STATIC_FILE_SIZE:
+            data = None
+            etag = f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+        else:
+            data = path.read_bytes()
+            etag = hashlib.blake2b(data, digest_size=16).hexdigest()
+        mimetype = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        static_files[path.relative_to(root).as_posix()] = (data, etag, mimetype, str(path))
+    
+    return static_files
+
+if FLASK_AVAILABLE and ORJSON_AVAILABLE:
+    class ORJSONProvider(DefaultJSONProvider):
+        """基于orjson的JSON序列化，不支持的类型仍交给Flask默认处理"""
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+        
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, default=self.default, option=self.option)
+            return self._app.response_class(body, mimetype=self.mimetype)
 
 def create_demo_app():
     """创建并启动演示应用"""
     print("🚀 启动Fed_MPC_Web服务器...")
     
-    from flask import Flask, jsonify, send_from_directory, request
-    from flask_cors import CORS
-    import json
-    from datetime import datetime
-    
     app = Flask(__name__, static_folder='frontend')
     
-    # 配置CORS
-    CORS(app, resources={
-        r"/*": {
-            "origins": ["http://localhost:*", "http://127.0.0.1:*"],
-            "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"]
-        }
-    })
+    # orjson可用时jsonify和request.get_json都走orjson
+    if ORJSON_AVAILABLE:
+        app.json = ORJSONProvider(app)
+    
+    # 配置CORS：按前缀匹配Origin，预检请求附加固定的允许方法和请求头
+    @app.after_request
+    def add_cors_headers(response):
+        origin = request.headers.get('Origin')
+        if origin and origin.startswith(CORS_ALLOWED_ORIGIN_PREFIXES):
+            response.headers['Access-Control-Allow-Origin'] = origin
+            response.vary.add('Origin')
+            if request.method == 'OPTIONS':
+                response.headers.update(CORS_PREFLIGHT_HEADERS)
+        return response
     
     # 模拟用户数据
     DEMO_USERS = {
@@ -59,175 +266,203 @@ def create_demo_app():
         'cryptographer': {'password': 'crypto123', 'type': 'client', 'business': 'crypto', 'name': '密码学专家'},
     }
     
+    # 登录校验表：用户名 -> 密码摘要，以及用户名 -> 预先序列化的登录成功响应体
+    password_digests = {
+        username: password_digest(user_info['password'])
+        for username, user_info in DEMO_USERS.items()
+    }
+    login_success_bodies = {
+        username: dump_json({
+            'success': True,
+            'token': f'demo_token_{username}',
+            'user': {
+                'id': username,
+                'name': user_info['name'],
+                'type': user_info['type'],
+                'business_type': user_info['business']
+            },
+            'message': '登录成功！'
+        })
+        for username, user_info in DEMO_USERS.items()
+    }
+    # 用户不存在时也做一次摘要比较，使耗时与密码错误一致
+    unknown_user_digest = password_digest('')
+    
+    def json_body_response(body, etag=None, status=200):
+        """直接返回预先序列化好的JSON响应体，提供etag时支持If-None-Match协商"""
+        if etag is None:
+            return app.response_class(body, status=status, mimetype='application/json')
+        
+        # 客户端接受时返回预先压缩的版本，不同编码使用不同的ETag
+        variants = COMPRESSED_BODIES.get(body)
+        encoding = request.accept_encodings.best_match(variants) if variants else None
+        if encoding:
+            body = variants[encoding]
+            etag = f'{etag}-{encoding}'
+        
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(body, mimetype='application/json')
+            if encoding:
+                response.content_encoding = encoding
+        response.set_etag(etag)
+        if variants:
+            response.vary.add('Accept-Encoding')
+        return response
+    
     # API路由
     @app.route('/api/health')
     def health_check():
-        return jsonify({
-            'status': 'healthy',
-            'message': 'Fed_MPC_Web is running',
-            'version': '1.0.0',
-            'timestamp': datetime.now().isoformat(),
-            'environment': 'production'
-        })
+        # 只有时间戳随请求变化，拼接到预先序列化的前缀后
+        return json_body_response(HEALTH_BODY_PREFIX + current_timestamp() + b'"}')
     
     @app.route('/api/test')
     def test_api():
-        return jsonify({
-            'success': True,
-            'message': 'API服务正常运行！',
-            'data': {
-                'modules': ['ai', 'blockchain', 'crypto'],
-                'features': ['联邦学习', '区块链交易', '密钥管理'],
-                'status': 'running'
-            }
-        })
+        return json_body_response(TEST_API_BODY, TEST_API_ETAG)
     
     @app.route('/api/auth/login', methods=['POST'])
     def login():
-        data = request.get_json() or {}
-        username = data.get('username')
-        password = data.get('password')
-        
-        if username in DEMO_USERS and DEMO_USERS[username]['password'] == password:
-            user_info = DEMO_USERS[username]
-            return jsonify({
-                'success': True,
-                'token': f'demo_token_{username}',
-                'user': {
-                    'id': username,
-                    'name': user_info['name'],
-                    'type': user_info['type'],
-                    'business_type': user_info['business']
-                },
-                'message': '登录成功！'
-            })
+        if MSGSPEC_AVAILABLE:
+            if not request.is_json:
+                abort(415)
+            try:
+                login_request = LOGIN_REQUEST_DECODER.decode(request.get_data())
+            except msgspec.ValidationError:
+                return json_body_response(LOGIN_FAILED_BODY, status=401)
+            except msgspec.DecodeError:
+                abort(400)
+            username = login_request.username
+            password = login_request.password
         else:
-            return jsonify({'error': '用户名或密码错误'}), 401
+            data = request.get_json() or {}
+            username = data.get('username')
+            password = data.get('password')
+        
+        if not isinstance(password, str):
+            return json_body_response(LOGIN_FAILED_BODY, status=401)
+        
+        expected = password_digests.get(username, unknown_user_digest)
+        if hmac.compare_digest(expected, password_digest(password)) and username in password_digests:
+            return json_body_response(login_success_bodies[username])
+        
+        return json_body_response(LOGIN_FAILED_BODY, status=401)
     
     @app.route('/api/ai/projects')
     def ai_projects():
-        return jsonify({
-            'success': True,
-            'data': {
-                'projects': [
-                    {'id': 1, 'name': 'CNN故障检测', 'status': 'active', 'accuracy': 0.923},
-                    {'id': 2, 'name': 'LSTM预测模型', 'status': 'completed', 'accuracy': 0.887},
-                    {'id': 3, 'name': '联邦学习项目', 'status': 'training', 'accuracy': 0.856}
-                ],
-                'total': 3
-            }
-        })
+        return json_body_response(AI_PROJECTS_BODY, AI_PROJECTS_ETAG)
     
     @app.route('/api/blockchain/transactions')
     def blockchain_transactions():
-        return jsonify({
-            'success': True,
-            'data': {
-                'transactions': [
-                    {'hash': '0x123...abc', 'status': 'confirmed', 'amount': 1.5},
-                    {'hash': '0x456...def', 'status': 'pending', 'amount': 0.8},
-                    {'hash': '0x789...ghi', 'status': 'confirmed', 'amount': 2.1}
-                ],
-                'total': 3
-            }
-        })
+        return json_body_response(BLOCKCHAIN_TRANSACTIONS_BODY, BLOCKCHAIN_TRANSACTIONS_ETAG)
     
     @app.route('/api/crypto/keys')
     def crypto_keys():
-        return jsonify({
-            'success': True,
-            'data': {
-                'keys': [
-                    {'id': 1, 'name': '主RSA密钥', 'type': 'RSA', 'size': 2048},
-                    {'id': 2, 'name': 'AES加密密钥', 'type': 'AES', 'size': 256},
-                    {'id': 3, 'name': 'ECC签名密钥', 'type': 'ECC', 'size': 256}
-                ],
-                'total': 3
-            }
-        })
+        return json_body_response(CRYPTO_KEYS_BODY, CRYPTO_KEYS_ETAG)
     
     # 前端路由
+    static_files = load_static_files(os.path.join(app.root_path, 'frontend'))
+    
+    def static_response(directory, filename):
+        """从启动时加载的文件表返回静态文件，文件不存在时返回None"""
+        record = static_files.get(f'{directory}/{filename}')
+        if record is None:
+            return None
+        
+        data, etag, mimetype, path = record
+        
+        # 浏览器缓存未变化时直接返回304
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        elif data is None:
+            # 大文件交给wsgi.file_wrapper，服务器支持时走sendfile零拷贝
+            response = app.response_class(
+                wrap_file(request.environ, open(path, 'rb')),
+                mimetype=mimetype,
+                direct_passthrough=True
+            )
+            response.content_length = os.path.getsize(path)
+        else:
+            response = app.response_class(data, mimetype=mimetype)
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 3600
+        return response
+    
     @app.route('/')
     def index():
-        import os
-        try:
-            # 尝试直接读取文件
-            homepage_path = os.path.join(os.path.dirname(__file__), 'frontend', 'homepage', 'index.html')
-            if os.path.exists(homepage_path):
-                with open(homepage_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            else:
-                # 如果文件不存在，使用send_from_directory
-                return send_from_directory('homepage', 'index.html')
-        except Exception as e:
-            print(f"Error loading homepage: {e}")
-            from flask import abort
+        response = static_response('homepage', 'index.html')
+        if response is None:
+            print("Error loading homepage: index.html not found")
             abort(500)  # 直接返回500错误，不显示任何演示页面
+        return response
     
-    @app.route('/ai/')
-    @app.route('/ai/<path:filename>')
-    def ai_module(filename=None):
-        try:
-            if filename:
-                return send_from_directory('frontend/ai', filename)
-            else:
-                return send_from_directory('frontend/ai/pages', 'main-dashboard.html')
-        except:
-            from flask import abort
-            abort(404)
-    
-    @app.route('/blockchain/')
-    @app.route('/blockchain/<path:filename>')
-    def blockchain_module(filename=None):
-        try:
-            if filename:
-                return send_from_directory('frontend/blockchain', filename)
-            else:
-                return send_from_directory('frontend/blockchain/pages', 'main-dashboard.html')
-        except:
-            from flask import abort
-            abort(404)
-    
-    @app.route('/crypto/')
-    @app.route('/crypto/<path:filename>')
-    def crypto_module(filename=None):
-        try:
-            if filename:
-                return send_from_directory('frontend/crypto', filename)
-            else:
-                return send_from_directory('frontend/crypto/pages', 'main-dashboard.html')
-        except:
-            from flask import abort
+    @app.route('/<any(ai, blockchain, crypto):module>/')
+    @app.route('/<any(ai, blockchain, crypto):module>/<path:filename>')
+    def module_page(module, filename=None):
+        if filename:
+            response = static_response(module, filename)
+        else:
+            response = static_response(f'{module}/pages', 'main-dashboard.html')
+        if response is None:
             abort(404)
+        return response
     
     @app.route('/shared/<path:filename>')
     def shared_files(filename):
-        try:
-            return send_from_directory('frontend/shared', filename)
-        except:
+        response = static_response('shared', filename)
+        if response is None:
             return "文件未找到", 404
+        return response
     
     return app
 
-def open_browser_delayed(url, delay=2):
-    """延迟打开浏览器"""
-    time.sleep(delay)
+def open_browser(url):
+    """打开浏览器"""
     try:
-        import webbrowser
         webbrowser.open(url)
         print(f"🌐 浏览器已打开: {url}")
     except:
         print(f"请手动访问: {url}")
 
+def serve_app(app, server):
+    """用指定的服务器运行应用，所需依赖未安装时退回Flask自带服务器"""
+    if server == 'waitress':
+        try:
+            from waitress import serve
+        except ImportError:
+            print("⚠️ 未安装waitress，改用Flask自带服务器")
+        else:
+            serve(app, host='127.0.0.1', port=8888, threads=8)
+            return
+    elif server == 'uvicorn':
+        try:
+            import uvicorn
+            from asgiref.wsgi import WsgiToAsgi
+        except ImportError:
+            print("⚠️ 未安装uvicorn/asgiref，改用Flask自带服务器")
+        else:
+            # loop/http为auto时，已安装uvloop、httptools则自动使用
+            uvicorn.run(WsgiToAsgi(app), host='127.0.0.1', port=8888, loop='auto', http='auto')
+            return
+    
+    app.run(host='127.0.0.1', port=8888, debug=False, threaded=True)
+
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description='Fed_MPC_Web 本地服务启动器')
+    parser.add_argument('--serve', choices=['waitress', 'uvicorn', 'flask'], default='waitress',
+                        help='使用的服务器，默认waitress，未安装时退回Flask自带服务器')
+    parser.add_argument('--bootstrap', action='store_true', help='自动安装缺失的依赖')
+    args = parser.parse_args()
+    
     print("="*60)
     print("🎯 Fed_MPC_Web 系统启动")
     print("="*60)
     
     try:
         # 检查依赖
-        install_requirements()
+        install_requirements(args.bootstrap)
         
         # 创建应用
         app = create_demo_app()
@@ -250,21 +485,18 @@ def main():
         print("📊 系统状态: 已启动，准备接收请求...")
         print("="*60)
         
-        # 在后台打开浏览器
-        threading.Thread(
-            target=open_browser_delayed,
-            args=('http://127.0.0.1:8888',),
-            daemon=True
-        ).start()
+        # 2秒后在后台打开浏览器
+        browser_timer = threading.Timer(2, open_browser, args=('http://127.0.0.1:8888',))
+        browser_timer.daemon = True
+        browser_timer.start()
         
-        # 启动Flask服务器
-        app.run(host='127.0.0.1', port=8888, debug=False, threaded=True)
+        # 启动服务器
+        serve_app(app, args.serve)
         
     except KeyboardInterrupt:
         print("\n👋 服务器已停止")
     except Exception as e:
         print(f"❌ 启动失败: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == '__main__':